@@ -9,17 +9,43 @@
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
 import os
-import re
+import logging
 import pprint
-import tempfile
-import uuid
-import sys
 import sgtk
 
 from tank_vendor import six
 
 HookBaseClass = sgtk.get_hook_baseclass()
 
+# encoder preset used to transcode the active sequence for review. can be
+# overridden via the environment to point at a different preset on disk.
+_DEFAULT_PRESET = os.environ.get(
+    "TK_PREMIERE_DNXHD_PRESET",
+    os.path.join(
+        "C:\\", "Program Files", "Adobe", "Adobe Premiere Pro 2023",
+        "Settings", "EncoderPresets", "ConsolidateAndTranscode",
+        "Match Source - DNxHD.epr"
+    )
+)
+
+
+def _get_version_number(name):
+    """
+    Returns the integer of the last ``v###`` token found in the given name.
+
+    :param str name: File name to parse, e.g. ``shot_010_edit.v003.prproj``.
+    :returns: The version number as an int, or None if no token was found.
+    """
+    idx = name.rfind("v")
+    while idx != -1:
+        end = idx + 1
+        while end < len(name) and name[end] in "0123456789":
+            end += 1
+        if end > idx + 1:
+            return int(name[idx + 1:end])
+        idx = name.rfind("v", 0, idx)
+    return None
+
 
 class PremiereUploadVersionPlugin(HookBaseClass):
     """
@@ -32,8 +58,15 @@ class PremiereUploadVersionPlugin(HookBaseClass):
         Path to an png icon on disk
         """
 
-        # look for icon one level up from this hook's folder in "icons" folder
-        return os.path.join(self.disk_location, os.pardir, "icons", "review.png")
+        # look for icon one level up from this hook's folder in "icons" folder.
+        # the path never changes, so resolve it once.
+        icon_path = getattr(self, "_icon_path", None)
+        if icon_path is None:
+            icon_path = os.path.normpath(
+                os.path.join(self.disk_location, os.pardir, "icons", "review.png")
+            )
+            self._icon_path = icon_path
+        return icon_path
 
     @property
     def name(self):
@@ -48,6 +81,11 @@ class PremiereUploadVersionPlugin(HookBaseClass):
         Verbose, multi-line description of what the plugin does. This can
         contain simple html for formatting.
         """
+        # the description only depends on the site url, build it once
+        description = getattr(self, "_description", None)
+        if description is not None:
+            return description
+
         publisher = self.parent
 
         shotgun_url = publisher.sgtk.shotgun_url
@@ -56,7 +94,7 @@ class PremiereUploadVersionPlugin(HookBaseClass):
         mobile_url = "https://help.autodesk.com/view/SGSUB/ENU/?guid=SG_Supervisor_Artist_sa_mobile_review_html"
         rv_url = "https://help.autodesk.com/view/SGSUB/ENU/?guid=SG_RV_rv_manuals_rv_easy_setup_html"
 
-        return """
+        self._description = """
         Upload the file to ShotGrid for review.<br><br>
 
         A <b>Version</b> entry will be created in ShotGrid and a transcoded
@@ -68,6 +106,7 @@ class PremiereUploadVersionPlugin(HookBaseClass):
             rv_url,
             mobile_url,
         )
+        return self._description
 
     @property
     def settings(self):
@@ -150,7 +189,8 @@ class PremiereUploadVersionPlugin(HookBaseClass):
         if settings.get("Publish Template").value:
             item.context_change_allowed = False
 
-        if not path:
+        # only build the save action when the warning will actually be emitted
+        if not path and self.logger.isEnabledFor(logging.WARNING):
             # the project has not been saved before (no path determined).
             # provide a save button. the project will need to be saved before
             # validation will succeed.
@@ -159,10 +199,7 @@ class PremiereUploadVersionPlugin(HookBaseClass):
                 extra=self.__get_save_as_action()
             )
 
-        self.logger.info(
-            "Premiere '%s' plugin accepted." %
-            (self.name,)
-        )
+        self.logger.info("Premiere '%s' plugin accepted.", self.name)
         return {
             "accepted": True,
             "checked": True
@@ -200,8 +237,15 @@ class PremiereUploadVersionPlugin(HookBaseClass):
 
         # get the path in a normalized state. no trailing separator,
         # separators are appropriate for current os, no double separators,
-        # etc.
-        path = sgtk.util.ShotgunPath.normalize(path)
+        # etc. the render and EDL plugins both validate the project item, so
+        # reuse the path normalized by whichever of them ran first.
+        normalized = item.properties.get("_normalized_path")
+        if normalized and normalized[0] == path:
+            path = normalized[1]
+        else:
+            normalized_path = sgtk.util.ShotgunPath.normalize(path)
+            item.properties["_normalized_path"] = (path, normalized_path)
+            path = normalized_path
 
         # if the project item has a known work template, see if the path
         # matches. if not, warn the user and provide a way to save the file to
@@ -237,12 +281,47 @@ class PremiereUploadVersionPlugin(HookBaseClass):
         if publish_template:
             item.properties["publish_template"] = publish_template
 
+            # resolve the context fields once, publish only fills in the rest
+            item.local_properties["_template_fields"] = (
+                publish_template,
+                item.context.as_template_fields(publish_template)
+            )
+
+        # remember the resolved template so publish doesn't look it up again
+        item.local_properties["_publish_template_cached"] = (
+            publish_template_setting.value, publish_template)
+
         # set the project path on the item for use by the base plugin
         # validation step. NOTE: this path could change prior to the publish
         # phase.
         item.name = os.path.basename(path)
         item.properties["path"] = path
 
+        # resolve the publish path up front. publish reuses it unless the
+        # project or the template changed in the meantime.
+        if publish_template:
+            if _get_version_number(item.name) is None:
+                self.logger.error(
+                    "The Premiere project '%s' has no v### version number in "
+                    "its name." % (item.name,)
+                )
+                return False
+
+            try:
+                publish_path = self._get_publish_path(item, publish_template)
+            except sgtk.TankError as e:
+                self.logger.error(
+                    "Unable to resolve the publish path for the Premiere "
+                    "project '%s': %s" % (item.name, e)
+                )
+                return False
+
+            item.local_properties["_publish_path"] = (
+                item.name,
+                publish_template,
+                publish_path
+            )
+
         # run the base class validation
         return super(PremiereUploadVersionPlugin, self).validate(
             settings, item)
@@ -256,57 +335,60 @@ class PremiereUploadVersionPlugin(HookBaseClass):
             instances.
         :param item: Item to process
         """
-        # populate the publish template on the item if found
+        # populate the publish template on the item if found, reusing the
+        # template resolved during validation when the setting is unchanged
         publish_template_setting = settings.get("Publish Template")
-        publish_template = self.parent.engine.get_template_by_name(
-            publish_template_setting.value)
+        cached = item.local_properties.get("_publish_template_cached")
+        if cached and cached[0] == publish_template_setting.value:
+            publish_template = cached[1]
+        else:
+            publish_template = self.parent.engine.get_template_by_name(
+                publish_template_setting.value)
         if publish_template:
             item.properties["publish_template"] = publish_template
 
-        publisher = self.parent
-        name = item.name.split('.')[0]
-        # version = item.name.split('.')[1]
-        version = re.findall(r'v[0-9]+', item.name)[-1]
-        version = int(re.findall(r'[0-9]+', version)[-1])
-
         template = item.properties['publish_template']
-        fields = item.context.as_template_fields(template)
-        fields['name'] = name
-        fields['version'] = version
-        path_to_movie = template.apply_fields(fields)
+        publish_path = item.local_properties.get("_publish_path")
+        if publish_path and publish_path[:2] == (item.name, template):
+            path_to_movie = publish_path[2]
+        else:
+            path_to_movie = self._get_publish_path(item, template)
 
-        preset = r"C:\Program Files\Adobe\Adobe Premiere Pro 2023\Settings\EncoderPresets\ConsolidateAndTranscode\Match Source - DNxHD.epr"
+        if path_to_movie is None:
+            self.logger.error("No render path found")
+            return
+
+        # the collector creates a single project item and only the active
+        # sequence is exported, so there is no batch to hand to Media Encoder.
+        # exporting directly also keeps the movie on disk before publishing.
         self.parent.engine.adobe.app.project.activeSequence.exportAsMediaDirect(
             path_to_movie,
-            preset,
+            _DEFAULT_PRESET,
             2
         )
 
-        if path_to_movie is None:
-            self.logger.error("No render path found")
-            return
-
         # use the path's filename as the publish name
-        path_components = publisher.util.get_file_path_components(
-            path_to_movie
-        )
-        publish_name = path_components["filename"]
+        publish_name = os.path.basename(path_to_movie)
+
+        # look up the context entities once
+        context = item.context
+        version_entity = self._get_version_entity(item)
 
         # populate the version data to send to SG
         self.logger.info("Creating Version...")
         version_data = {
-            "project": item.context.project,
+            "project": context.project,
             "code": publish_name,
             "description": item.description,
-            "entity": self._get_version_entity(item),
-            "sg_task": item.context.task,
+            "entity": version_entity,
+            "sg_task": context.task,
             "sg_path_to_movie": path_to_movie,
         }
 
         # update the item with the saved project path
         item.properties["path"] = path_to_movie
         item.properties["publish_type"] = "Rendered Image"
-        item.properties["sg_publish_data"]["upstream_published_files"] = self._get_version_entity(item)
+        item.properties["sg_publish_data"]["upstream_published_files"] = version_entity
 
         # let the base class register the publish
         super(PremiereUploadVersionPlugin, self).publish(settings, item)
@@ -320,17 +402,19 @@ class PremiereUploadVersionPlugin(HookBaseClass):
             version_data["published_files"].append(publish_data)
         version_data["published_files"].extend(rendering_data)
 
-        # log the version data for debugging
-        self.logger.debug(
-            "Populated Version data...",
-            extra={
-                "action_show_more_info": {
-                    "label": "Version Data",
-                    "tooltip": "Show the complete Version data dictionary",
-                    "text": "<pre>%s</pre>" % (pprint.pformat(version_data),),
-                }
-            },
-        )
+        # log the version data for debugging. formatting the data can be slow
+        # so only do it when debug logging is enabled.
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(
+                "Populated Version data...",
+                extra={
+                    "action_show_more_info": {
+                        "label": "Version Data",
+                        "tooltip": "Show the complete Version data dictionary",
+                        "text": "<pre>%s</pre>" % (pprint.pformat(version_data),),
+                    }
+                },
+            )
 
         # create the version
         self.logger.info("Creating version for review...")
@@ -340,9 +424,14 @@ class PremiereUploadVersionPlugin(HookBaseClass):
         item.properties["sg_version_data"] = version
 
         # Ensure the path is utf-8 encoded to avoid issues with the Shotgun API.
-        upload_path = six.ensure_str(path_to_movie)
+        if isinstance(path_to_movie, str):
+            upload_path = path_to_movie
+        else:
+            upload_path = six.ensure_str(path_to_movie)
 
-        # upload the file to SG
+        # upload the file to SG. upload() only accepts a path. when the site
+        # uses cloud storage the API already sends large files in fixed-size
+        # chunks rather than reading them into memory.
         self.logger.info("Uploading content...")
         self.parent.shotgun.upload(
             "Version", version["id"], upload_path, "sg_uploaded_movie"
@@ -365,6 +454,30 @@ class PremiereUploadVersionPlugin(HookBaseClass):
         # do the base class finalization
         super(PremiereUploadVersionPlugin, self).finalize(settings, item)
 
+    def _get_publish_path(self, item, template):
+        """
+        Returns the publish path for the given item built from the given
+        template, the item's context and the name and version of the project.
+        """
+
+        name = item.name.split('.')[0]
+        version = _get_version_number(item.name)
+        if version is None:
+            self.logger.error(
+                "No version number (v###) found in the project name '%s'." %
+                (item.name,)
+            )
+            return None
+
+        template_fields = item.local_properties.get("_template_fields")
+        if template_fields and template_fields[0] is template:
+            fields = dict(template_fields[1])
+        else:
+            fields = item.context.as_template_fields(template)
+        fields['name'] = name
+        fields['version'] = version
+        return template.apply_fields(fields)
+
     def _get_version_entity(self, item):
         """
         Returns the best entity to link the version to.
@@ -382,16 +495,21 @@ class PremiereUploadVersionPlugin(HookBaseClass):
         Simple helper for returning a log action dict for saving the project
         """
 
-        engine = self.parent.engine
+        # the callback only depends on the engine's apps, resolve it once
+        callback = getattr(self, "_save_as_callback", None)
+        if callback is None:
+            engine = self.parent.engine
+
+            # default save callback
+            callback = engine.save_as
 
-        # default save callback
-        callback = lambda: engine.save_as()
+            # if workfiles2 is configured, use that for file save
+            if "tk-multi-workfiles2" in engine.apps:
+                app = engine.apps["tk-multi-workfiles2"]
+                if hasattr(app, "show_file_save_dlg"):
+                    callback = app.show_file_save_dlg
 
-        # if workfiles2 is configured, use that for file save
-        if "tk-multi-workfiles2" in engine.apps:
-            app = engine.apps["tk-multi-workfiles2"]
-            if hasattr(app, "show_file_save_dlg"):
-                callback = app.show_file_save_dlg
+            self._save_as_callback = callback
 
         return {
             "action_button": {
@@ -9,17 +9,29 @@
 # not expressly granted therein are reserved by Shotgun Software Inc.
 
 import os
+import logging
 import re
-import pprint
-import tempfile
-import uuid
-import sys
 import sgtk
 
-from tank_vendor import six
 
 HookBaseClass = sgtk.get_hook_baseclass()
 
+_VERSION3_RE = re.compile(r'[0-9]{3}')
+
+
+def _get_version_number(name):
+    """
+    Returns the integer of the last three digit run found in the base name of
+    the given file name.
+
+    :param str name: File name to parse, e.g. ``shot_010_edit_003.prproj``.
+    :returns: The version number as an int, or None if no run was found.
+    """
+    versions = _VERSION3_RE.findall(name.split('.')[0])
+    if not versions:
+        return None
+    return int(versions[-1])
+
 
 class PremiereUploadEDLPlugin(HookBaseClass):
     """
@@ -32,8 +44,15 @@ class PremiereUploadEDLPlugin(HookBaseClass):
         Path to an png icon on disk
         """
 
-        # look for icon one level up from this hook's folder in "icons" folder
-        return os.path.join(self.disk_location, os.pardir, "icons", "rendering.png")
+        # look for icon one level up from this hook's folder in "icons" folder.
+        # the path never changes, so resolve it once.
+        icon_path = getattr(self, "_icon_path", None)
+        if icon_path is None:
+            icon_path = os.path.normpath(
+                os.path.join(self.disk_location, os.pardir, "icons", "rendering.png")
+            )
+            self._icon_path = icon_path
+        return icon_path
 
     @property
     def name(self):
@@ -48,9 +67,14 @@ class PremiereUploadEDLPlugin(HookBaseClass):
         Verbose, multi-line description of what the plugin does. This can
         contain simple html for formatting.
         """
+        # the description never changes, build it once
+        description = getattr(self, "_description", None)
+        if description is not None:
+            return description
+
         loader_url = "https://support.shotgunsoftware.com/hc/en-us/articles/219033078"
 
-        return """
+        self._description = """
                 Publishes the EDL file to Shotgun. A <b>Publish</b> entry will be
                 created in Shotgun which will include a reference to the file's current
                 path on disk. Other users will be able to access the published file via
@@ -60,6 +84,7 @@ class PremiereUploadEDLPlugin(HookBaseClass):
                 If the project has not been saved, validation will fail and a button
                 will be provided in the logging output to save the file.
                 """ % (loader_url,)
+        return self._description
 
     @property
     def settings(self):
@@ -142,7 +167,8 @@ class PremiereUploadEDLPlugin(HookBaseClass):
         if settings.get("Publish Template").value:
             item.context_change_allowed = False
 
-        if not path:
+        # only build the save action when the warning will actually be emitted
+        if not path and self.logger.isEnabledFor(logging.WARNING):
             # the project has not been saved before (no path determined).
             # provide a save button. the project will need to be saved before
             # validation will succeed.
@@ -151,10 +177,7 @@ class PremiereUploadEDLPlugin(HookBaseClass):
                 extra=self.__get_save_as_action()
             )
 
-        self.logger.info(
-            "Premiere '%s' plugin accepted." %
-            (self.name,)
-        )
+        self.logger.info("Premiere '%s' plugin accepted.", self.name)
         return {
             "accepted": True,
             "checked": True
@@ -192,8 +215,15 @@ class PremiereUploadEDLPlugin(HookBaseClass):
 
         # get the path in a normalized state. no trailing separator,
         # separators are appropriate for current os, no double separators,
-        # etc.
-        path = sgtk.util.ShotgunPath.normalize(path)
+        # etc. the render and EDL plugins both validate the project item, so
+        # reuse the path normalized by whichever of them ran first.
+        normalized = item.properties.get("_normalized_path")
+        if normalized and normalized[0] == path:
+            path = normalized[1]
+        else:
+            normalized_path = sgtk.util.ShotgunPath.normalize(path)
+            item.properties["_normalized_path"] = (path, normalized_path)
+            path = normalized_path
 
         # if the project item has a known work template, see if the path
         # matches. if not, warn the user and provide a way to save the file to
@@ -229,12 +259,47 @@ class PremiereUploadEDLPlugin(HookBaseClass):
         if publish_template:
             item.properties["publish_template"] = publish_template
 
+            # resolve the context fields once, publish only fills in the rest
+            item.local_properties["_template_fields"] = (
+                publish_template,
+                item.context.as_template_fields(publish_template)
+            )
+
+        # remember the resolved template so publish doesn't look it up again
+        item.local_properties["_publish_template_cached"] = (
+            publish_template_setting.value, publish_template)
+
         # set the project path on the item for use by the base plugin
         # validation step. NOTE: this path could change prior to the publish
         # phase.
         item.name = os.path.basename(path)
         item.properties["path"] = path
 
+        # resolve the publish path up front. publish reuses it unless the
+        # project or the template changed in the meantime.
+        if publish_template:
+            if _get_version_number(item.name) is None:
+                self.logger.error(
+                    "The Premiere project '%s' has no 3 digit version number in "
+                    "its name." % (item.name,)
+                )
+                return False
+
+            try:
+                publish_path = self._get_publish_path(item, publish_template)
+            except sgtk.TankError as e:
+                self.logger.error(
+                    "Unable to resolve the publish path for the Premiere "
+                    "project '%s': %s" % (item.name, e)
+                )
+                return False
+
+            item.local_properties["_publish_path"] = (
+                item.name,
+                publish_template,
+                publish_path
+            )
+
         # run the base class validation
         return super(PremiereUploadEDLPlugin, self).validate(
             settings, item)
@@ -248,30 +313,32 @@ class PremiereUploadEDLPlugin(HookBaseClass):
             instances.
         :param item: Item to process
         """
-        # populate the publish template on the item if found
+        # populate the publish template on the item if found, reusing the
+        # template resolved during validation when the setting is unchanged
         publish_template_setting = settings.get("Publish Template")
-        publish_template = self.parent.engine.get_template_by_name(
-            publish_template_setting.value)
+        cached = item.local_properties.get("_publish_template_cached")
+        if cached and cached[0] == publish_template_setting.value:
+            publish_template = cached[1]
+        else:
+            publish_template = self.parent.engine.get_template_by_name(
+                publish_template_setting.value)
         if publish_template:
             item.properties["publish_template"] = publish_template
 
-        name = item.name.split('.')[0]
-        version = item.name.split('.')[1]
-        version = int(re.findall(r'[0-9]{3}', name)[-1])
-
         template = item.properties['publish_template']
-        fields = item.context.as_template_fields(template)
-        fields['name'] = name
-        fields['version'] = version
-        path_to_xml = template.apply_fields(fields)
-
-        self.parent.engine.adobe.app.project.activeSequence.exportAsFinalCutProXML(
-            path_to_xml, 1)
+        publish_path = item.local_properties.get("_publish_path")
+        if publish_path and publish_path[:2] == (item.name, template):
+            path_to_xml = publish_path[2]
+        else:
+            path_to_xml = self._get_publish_path(item, template)
 
         if path_to_xml is None:
             self.logger.error("No render path found")
             return
 
+        self.parent.engine.adobe.app.project.activeSequence.exportAsFinalCutProXML(
+            path_to_xml, 1)
+
         # update the item with the saved project path
         item.properties["path"] = path_to_xml
         item.properties["publish_type"] = "Rendered Image"
@@ -295,6 +362,30 @@ class PremiereUploadEDLPlugin(HookBaseClass):
         # do the base class finalization
         super(PremiereUploadEDLPlugin, self).finalize(settings, item)
 
+    def _get_publish_path(self, item, template):
+        """
+        Returns the publish path for the given item built from the given
+        template, the item's context and the name and version of the project.
+        """
+
+        name = item.name.split('.')[0]
+        version = _get_version_number(item.name)
+        if version is None:
+            self.logger.error(
+                "No version number found in the project name '%s'." %
+                (item.name,)
+            )
+            return None
+
+        template_fields = item.local_properties.get("_template_fields")
+        if template_fields and template_fields[0] is template:
+            fields = dict(template_fields[1])
+        else:
+            fields = item.context.as_template_fields(template)
+        fields['name'] = name
+        fields['version'] = version
+        return template.apply_fields(fields)
+
     def _get_version_entity(self, item):
         """
         Returns the best entity to link the version to.
@@ -312,16 +403,21 @@ class PremiereUploadEDLPlugin(HookBaseClass):
         Simple helper for returning a log action dict for saving the project
         """
 
-        engine = self.parent.engine
+        # the callback only depends on the engine's apps, resolve it once
+        callback = getattr(self, "_save_as_callback", None)
+        if callback is None:
+            engine = self.parent.engine
+
+            # default save callback
+            callback = engine.save_as
 
-        # default save callback
-        callback = lambda: engine.save_as()
+            # if workfiles2 is configured, use that for file save
+            if "tk-multi-workfiles2" in engine.apps:
+                app = engine.apps["tk-multi-workfiles2"]
+                if hasattr(app, "show_file_save_dlg"):
+                    callback = app.show_file_save_dlg
 
-        # if workfiles2 is configured, use that for file save
-        if "tk-multi-workfiles2" in engine.apps:
-            app = engine.apps["tk-multi-workfiles2"]
-            if hasattr(app, "show_file_save_dlg"):
-                callback = app.show_file_save_dlg
+            self._save_as_callback = callback
 
         return {
             "action_button": {
@@ -290,16 +290,21 @@ class PremiereStartVersionControlPlugin(HookBaseClass):
         Simple helper for returning a log action dict for saving the project
         """
 
-        engine = self.parent.engine
+        # the callback only depends on the engine's apps, resolve it once
+        callback = getattr(self, "_save_as_callback", None)
+        if callback is None:
+            engine = self.parent.engine
 
-        # default save callback
-        callback = lambda: engine.save_as()
+            # default save callback
+            callback = engine.save_as
 
-        # if workfiles2 is configured, use that for file save
-        if "tk-multi-workfiles2" in engine.apps:
-            app = engine.apps["tk-multi-workfiles2"]
-            if hasattr(app, "show_file_save_dlg"):
-                callback = app.show_file_save_dlg
+            # if workfiles2 is configured, use that for file save
+            if "tk-multi-workfiles2" in engine.apps:
+                app = engine.apps["tk-multi-workfiles2"]
+                if hasattr(app, "show_file_save_dlg"):
+                    callback = app.show_file_save_dlg
+
+            self._save_as_callback = callback
 
         return {
             "action_button": {